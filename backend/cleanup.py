@@ -6,9 +6,14 @@ Scheduled cleanup script for old TTS files
 
 import os
 import sys
-from datetime import datetime, timedelta
+import time
 from minio import Minio
+from minio.commonconfig import ENABLED, Filter
+from minio.deleteobjects import DeleteObject
 from minio.error import S3Error
+from minio.lifecycleconfig import Expiration, LifecycleConfig, Rule
+import urllib3
+from urllib3.util.retry import Retry
 
 # Configuration
 MINIO_ENDPOINT = os.getenv("MINIO_ENDPOINT", "minio:9000")
@@ -18,39 +23,100 @@ MINIO_BUCKET = os.getenv("MINIO_BUCKET", "tts-audio")
 MINIO_SECURE = os.getenv("MINIO_SECURE", "false").lower() == "true"
 CLEANUP_INTERVAL_HOURS = int(os.getenv("CLEANUP_INTERVAL_HOURS", "1"))
 
+# Object keys are <time-prefix>/<ulid>.mp3 (see _object_name in main.py);
+# the prefix is the first chars of the ULID's Crockford base32 timestamp
+ULID_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+KEY_PREFIX_LEN = 6
+
+
+def _time_prefix(ts):
+    """ULID timestamp chars for the given epoch seconds, truncated to the
+    key prefix length"""
+    ms = int(ts * 1000)
+    chars = ''.join(ULID_ALPHABET[(ms >> shift) & 0x1F] for shift in range(45, -1, -5))
+    return chars[:KEY_PREFIX_LEN]
+
+def _make_client() -> Minio:
+    return Minio(
+        MINIO_ENDPOINT,
+        access_key=MINIO_ACCESS_KEY,
+        secret_key=MINIO_SECRET_KEY,
+        secure=MINIO_SECURE,
+        http_client=urllib3.PoolManager(
+            num_pools=4,
+            maxsize=32,
+            retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504])
+        )
+    )
+
+
+def install_lifecycle_rule(minio_client) -> bool:
+    """Install a server-side expiry rule so MinIO deletes old audio itself.
+
+    Idempotent; returns False if the backend rejects lifecycle configs,
+    in which case the caller falls back to a client-side scan.
+    """
+    try:
+        minio_client.set_bucket_lifecycle(MINIO_BUCKET, LifecycleConfig([
+            Rule(
+                ENABLED,
+                rule_id="tts-expire",
+                rule_filter=Filter(prefix=""),
+                expiration=Expiration(days=1)
+            )
+        ]))
+        print("Lifecycle expiry rule installed; MinIO handles deletion server-side")
+        return True
+    except S3Error as e:
+        print(f"Could not install lifecycle rule, falling back to scan: {e}")
+        return False
+
+
 def cleanup_old_files():
     """Remove files older than CLEANUP_INTERVAL_HOURS"""
     try:
-        minio_client = Minio(
-            MINIO_ENDPOINT,
-            access_key=MINIO_ACCESS_KEY,
-            secret_key=MINIO_SECRET_KEY,
-            secure=MINIO_SECURE
-        )
-        
+        minio_client = _make_client()
+
         if not minio_client.bucket_exists(MINIO_BUCKET):
             print(f"Bucket {MINIO_BUCKET} does not exist")
             return
-        
-        # List all objects
-        objects = minio_client.list_objects(MINIO_BUCKET, recursive=True)
-        
-        deleted_count = 0
-        now = datetime.utcnow()
-        cutoff_time = now - timedelta(hours=CLEANUP_INTERVAL_HOURS)
-        
-        for obj in objects:
-            if obj.last_modified:
-                # Remove timezone info for comparison
-                obj_time = obj.last_modified.replace(tzinfo=None)
-                if obj_time < cutoff_time:
-                    try:
-                        minio_client.remove_object(MINIO_BUCKET, obj.object_name)
-                        deleted_count += 1
-                        print(f"Deleted: {obj.object_name} (age: {now - obj_time})")
-                    except Exception as e:
-                        print(f"Error deleting {obj.object_name}: {e}")
-        
+
+        if install_lifecycle_rule(minio_client):
+            return 0
+
+        # Fallback: walk time-bucket prefixes at or before the cutoff and
+        # stream expired objects into batched multi-delete calls (up to
+        # 1000 keys per RPC). Epoch-float comparison avoids a tz-replace
+        # and timedelta per object
+        cutoff = time.time() - CLEANUP_INTERVAL_HOURS * 3600
+        cutoff_prefix = _time_prefix(cutoff)
+        submitted = 0
+
+        def candidates():
+            nonlocal submitted
+            for entry in minio_client.list_objects(MINIO_BUCKET):
+                if entry.is_dir:
+                    prefix = entry.object_name
+                    if prefix.rstrip('/') > cutoff_prefix:
+                        continue
+                    # Windows strictly before the cutoff prefix are expired
+                    # wholesale; the boundary window needs mtime checks
+                    whole_window = prefix.rstrip('/') < cutoff_prefix
+                    for obj in minio_client.list_objects(MINIO_BUCKET, prefix=prefix, recursive=True):
+                        if whole_window or (obj.last_modified and obj.last_modified.timestamp() < cutoff):
+                            submitted += 1
+                            yield DeleteObject(obj.object_name)
+                elif entry.last_modified and entry.last_modified.timestamp() < cutoff:
+                    # Flat key from before the prefix scheme
+                    submitted += 1
+                    yield DeleteObject(entry.object_name)
+
+        errors = 0
+        for err in minio_client.remove_objects(MINIO_BUCKET, candidates()):
+            errors += 1
+            print(f"Error deleting {err.name}: {err.message}")
+
+        deleted_count = submitted - errors
         print(f"Cleanup completed: {deleted_count} files deleted")
         return deleted_count
     
@@ -6,19 +6,26 @@ FastAPI backend for text-to-speech service
 
 import os
 import re
-import uuid
+import time
 import asyncio
+import hashlib
 from datetime import datetime, timedelta
-from pathlib import Path
+from io import BytesIO
 from typing import Optional
 
 import edge_tts
-from fastapi import FastAPI, HTTPException, UploadFile, File
+from fastapi import FastAPI, HTTPException, Request, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, StreamingResponse, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse, Response
 from pydantic import BaseModel, Field
 from minio import Minio
+from minio.commonconfig import ENABLED, Filter
+from minio.deleteobjects import DeleteObject
 from minio.error import S3Error
+from minio.lifecycleconfig import Expiration, LifecycleConfig, Rule
+from ulid import ULID
+import urllib3
+from urllib3.util.retry import Retry
 import uvicorn
 
 # Configuration
@@ -28,46 +35,104 @@ MINIO_SECRET_KEY = os.getenv("MINIO_SECRET_KEY", "minioadmin")
 MINIO_BUCKET = os.getenv("MINIO_BUCKET", "tts-audio")
 MINIO_SECURE = os.getenv("MINIO_SECURE", "false").lower() == "true"
 
-TEMP_DIR = Path("/tmp/tts")
-TEMP_DIR.mkdir(exist_ok=True)
-
 # File cleanup interval (1 hour)
 CLEANUP_INTERVAL = timedelta(hours=1)
 
-app = FastAPI(title="TTS Service", version="1.0.0")
+# Max concurrent edge-tts synths for one multi-part request
+PART_CONCURRENCY = int(os.getenv("TTS_PART_CONCURRENCY", "4"))
+
+# Global cap on in-flight TTS requests so bursts stay below the Microsoft
+# throttle and don't starve the MinIO connection pool
+TTS_CONCURRENT_REQUESTS = int(os.getenv("TTS_CONCURRENT_REQUESTS", "6"))
+TTS_SEM = asyncio.Semaphore(TTS_CONCURRENT_REQUESTS)
+
+app = FastAPI(title="TTS Service", version="1.0.0", default_response_class=ORJSONResponse)
+
+# CORS middleware - a concrete origin list keeps Starlette on its fast
+# path (static headers) instead of echoing the Origin per response
+CORS_ORIGINS = os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",")
 
-# CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, specify your frontend domain
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "DELETE"],
+    allow_headers=["content-type", "authorization"],
+)
+
+# MinIO client with an explicit connection pool so concurrent requests
+# reuse sockets instead of paying a TCP/TLS handshake each time
+_minio_http = urllib3.PoolManager(
+    num_pools=4,
+    maxsize=32,
+    retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504])
 )
 
-# MinIO client
 minio_client = Minio(
     MINIO_ENDPOINT,
     access_key=MINIO_ACCESS_KEY,
     secret_key=MINIO_SECRET_KEY,
-    secure=MINIO_SECURE
+    secure=MINIO_SECURE,
+    http_client=_minio_http
 )
 
-# Ensure bucket exists
+# Lifecycle rule so MinIO expires old audio server-side; day granularity is
+# the S3 minimum, so this is a backstop behind the hour-level /api/cleanup
+LIFECYCLE_CONFIG = LifecycleConfig([
+    Rule(
+        ENABLED,
+        rule_id="tts-expire",
+        rule_filter=Filter(prefix=""),
+        expiration=Expiration(days=1)
+    )
+])
+
+# Ensure bucket exists and has the expiry rule installed
 try:
     if not minio_client.bucket_exists(MINIO_BUCKET):
         minio_client.make_bucket(MINIO_BUCKET)
+    minio_client.set_bucket_lifecycle(MINIO_BUCKET, LIFECYCLE_CONFIG)
 except S3Error as e:
     print(f"Warning: Could not connect to MinIO: {e}")
 
 
+# ULID file ids: 26 Crockford base32 chars, time-sortable
+_FILE_ID_RE = re.compile(r'[0-9A-HJKMNP-TV-Z]{26}$')
+
+_ULID_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+# Key prefix length in ULID timestamp chars. The full 48-bit millisecond
+# timestamp occupies the first 10 chars, so truncating to 6 buckets keys
+# into ~17.5-minute windows - coarse enough that cleanup only lists a few
+# prefixes, fine enough that a window expires as a unit
+_KEY_PREFIX_LEN = 6
+
+
+def _time_prefix(ts: float) -> str:
+    """ULID timestamp chars for the given epoch seconds, truncated to the
+    key prefix length"""
+    ms = int(ts * 1000)
+    chars = ''.join(_ULID_ALPHABET[(ms >> shift) & 0x1F] for shift in range(45, -1, -5))
+    return chars[:_KEY_PREFIX_LEN]
+
+
+def _object_name(file_id: str) -> str:
+    """Map a file id to its MinIO key.
+
+    The time-bucket prefix comes from the ULID's timestamp chars, so
+    cleanup can list just the expired windows instead of walking the
+    whole bucket.
+    """
+    return f"{file_id[:_KEY_PREFIX_LEN]}/{file_id}.mp3"
+
+
 class TTSRequest(BaseModel):
     text: str = Field(..., min_length=1, max_length=50000, description="Text to convert to speech")
-    voice: Optional[str] = Field(default="en-US-DavisNeural", description="Voice name for TTS")
-    language: Optional[str] = Field(default="en", description="Language code")
-    rate: Optional[str] = Field(default="+0%", description="Speech rate (-50% to +100%)")
-    pitch: Optional[str] = Field(default="+0Hz", description="Voice pitch (-50Hz to +50Hz)")
-    volume: Optional[str] = Field(default="+0%", description="Voice volume (-50% to +100%)")
+    voice: str = Field(default="en-US-DavisNeural", description="Voice name for TTS")
+    language: str = Field(default="en", description="Language code")
+    rate: str = Field(default="+0%", description="Speech rate (-50% to +100%)")
+    pitch: str = Field(default="+0Hz", description="Voice pitch (-50Hz to +50Hz)")
+    volume: str = Field(default="+0%", description="Voice volume (-50% to +100%)")
 
 
 class TTSResponse(BaseModel):
@@ -76,116 +141,137 @@ class TTSResponse(BaseModel):
     expires_at: str
 
 
+# Patterns for clean_text: one alternation strips all markdown and HTML in
+# a single pass, one pattern handles pronunciation/punctuation. Every
+# construct is negated-class based, so no DOTALL-style flag is needed
+_MARKDOWN_PATTERN = (
+    r'```[^`]+```'                    # code blocks (dropped)
+    r'|\[([^\]]+)\]\([^\)]+\)'        # links (keep text)
+    r'|\*\*([^\*]+)\*\*'              # bold (keep text)
+    r'|\*([^\*]+)\*'                  # italic (keep text)
+    r'|`([^`]+)`'                     # inline code (keep text)
+    r'|<[^>]+>'                       # HTML tags (dropped)
+)
+
+# Pronunciation fixes for common technical terms, plus punctuation
+# normalization; HTTPS must come before HTTP in the alternation
+_TERM_REPLACEMENTS = {
+    'kubectl': 'kube control',
+    '2FA': 'two factor authentication',
+    'SSH': 'S S H',
+    'HTTPS': 'H T T P S',
+    'HTTP': 'H T T P',
+    'API': 'A P I',
+    'CRUD': 'C R U D',
+    'SMTP': 'S M T P',
+    '...': '.',
+    '--': '-',
+}
+_TERMS_PATTERN = r'\b(?:kubectl|2FA|SSH|HTTPS|HTTP|API|CRUD|SMTP)\b|\.\.\.|--'
+
+# Sentence boundary for the long-text splitter
+_SENT_END_PATTERN = r'[.!?]\s+'
+
+
+def _compile_patterns(engine):
+    return (
+        engine.compile(_MARKDOWN_PATTERN),
+        engine.compile(r'\s+'),
+        engine.compile(_TERMS_PATTERN),
+        engine.compile(_SENT_END_PATTERN),
+    )
+
+
+# Prefer RE2 (linear-time DFA) for the cleaning patterns so adversarial
+# markdown can't trigger catastrophic backtracking on 50k-char inputs.
+# Compile inside the guard: google-re2 doesn't expose re-style flags, so
+# fall back to stdlib re if the binding is missing or API-incompatible
+try:
+    import re2 as _regex
+    _MARKDOWN_RE, _WHITESPACE_RE, _TERMS_RE, _SENT_END_RE = _compile_patterns(_regex)
+except Exception:
+    _regex = re
+    _MARKDOWN_RE, _WHITESPACE_RE, _TERMS_RE, _SENT_END_RE = _compile_patterns(re)
+
+
+def _strip_markdown(match) -> str:
+    # Return the kept-text group if one matched, otherwise drop the match
+    for group in match.groups():
+        if group is not None:
+            return group
+    return ''
+
+
 def clean_text(text: str) -> str:
     """Clean text for TTS - remove markdown, fix formatting"""
-    # Remove markdown links but keep text
-    text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
-    # Remove markdown bold/italic
-    text = re.sub(r'\*\*([^\*]+)\*\*', r'\1', text)
-    text = re.sub(r'\*([^\*]+)\*', r'\1', text)
-    # Remove code blocks
-    text = re.sub(r'```[^`]+```', '', text, flags=re.DOTALL)
-    # Remove inline code but keep text
-    text = re.sub(r'`([^`]+)`', r'\1', text)
-    # Remove HTML tags if any
-    text = re.sub(r'<[^>]+>', '', text)
+    # Remove markdown/HTML markup in a single pass
+    text = _MARKDOWN_RE.sub(_strip_markdown, text)
     # Remove extra whitespace and normalize
-    text = re.sub(r'\s+', ' ', text)
-    text = text.strip()
-    
-    # Fix common technical terms for better pronunciation
-    replacements = {
-        'kubectl': 'kube control',
-        '2FA': 'two factor authentication',
-        'SSH': 'S S H',
-        'HTTP': 'H T T P',
-        'HTTPS': 'H T T P S',
-        'API': 'A P I',
-        'CRUD': 'C R U D',
-        'SMTP': 'S M T P',
-    }
-    
-    for old, new in replacements.items():
-        text = text.replace(old, new)
-    
-    # Fix punctuation for better TTS flow
-    text = text.replace('...', '.')
-    text = text.replace('--', '-')
-    
+    text = _WHITESPACE_RE.sub(' ', text).strip()
+    # Fix technical terms and punctuation for better pronunciation
+    text = _TERMS_RE.sub(lambda m: _TERM_REPLACEMENTS[m.group(0)], text)
+
     return text
 
 
-async def generate_audio_async(text: str, output_file: str, voice: str = "en-US-DavisNeural", rate: str = "+0%", pitch: str = "+0Hz", volume: str = "+0%") -> bool:
-    """Generate MP3 audio file from text using edge-tts"""
+def _split_text(text: str, max_length: int) -> list:
+    """Split text into parts of at most max_length chars at sentence boundaries.
+
+    Single finditer pass over the text, slicing parts directly instead of
+    building an intermediate sentence list and re-joining pairs.
+    """
+    parts = []
+    part_start = 0
+    prev_end = 0
+
+    for match in _SENT_END_RE.finditer(text):
+        end = match.end()
+        if end - part_start > max_length and prev_end > part_start:
+            parts.append(text[part_start:prev_end])
+            part_start = prev_end
+        prev_end = end
+
+    if len(text) - part_start > max_length and prev_end > part_start:
+        parts.append(text[part_start:prev_end])
+        part_start = prev_end
+
+    if part_start < len(text):
+        parts.append(text[part_start:])
+
+    return parts
+
+
+async def generate_audio_async(text: str, voice: str = "en-US-DavisNeural", rate: str = "+0%", pitch: str = "+0Hz", volume: str = "+0%") -> Optional[bytes]:
+    """Generate MP3 audio from text using edge-tts, returning the raw bytes"""
     max_length = 10000
-    
+
     if len(text) <= max_length:
-        return await _generate_single_audio_async(text, output_file, voice, rate, pitch, volume)
+        return await _generate_single_audio_async(text, voice, rate, pitch, volume)
     else:
-        # Split text into parts
-        parts = []
-        sentences = re.split(r'([.!?]\s+)', text)
-        current_part = []
-        current_length = 0
-        
-        for i in range(0, len(sentences), 2):
-            sentence = sentences[i] + (sentences[i+1] if i+1 < len(sentences) else '')
-            sentence_length = len(sentence)
-            
-            if current_length + sentence_length > max_length and current_part:
-                parts.append(''.join(current_part))
-                current_part = [sentence]
-                current_length = sentence_length
-            else:
-                current_part.append(sentence)
-                current_length += sentence_length
-        
-        if current_part:
-            parts.append(''.join(current_part))
-        
-        # Generate each part
-        temp_files = []
-        for i, part in enumerate(parts):
-            temp_file = output_file.replace('.mp3', f'_part{i+1}.mp3')
-            if await _generate_single_audio_async(part, temp_file, voice, rate, pitch, volume):
-                temp_files.append(temp_file)
-            else:
-                # Cleanup on error
-                for tf in temp_files:
-                    try:
-                        os.remove(tf)
-                    except:
-                        pass
-                return False
-        
-        # Merge parts using pydub
-        if temp_files:
-            if len(temp_files) == 1:
-                os.rename(temp_files[0], output_file)
-            else:
-                try:
-                    from pydub import AudioSegment
-                    combined = AudioSegment.empty()
-                    for tf in temp_files:
-                        combined += AudioSegment.from_mp3(tf)
-                    combined.export(output_file, format="mp3")
-                    # Remove temp files
-                    for tf in temp_files:
-                        try:
-                            os.remove(tf)
-                        except:
-                            pass
-                except ImportError:
-                    # If pydub not available, use first part
-                    for tf in temp_files[1:]:
-                        try:
-                            os.remove(tf)
-                        except:
-                            pass
-                    os.rename(temp_files[0], output_file)
-            return True
-        
-        return False
+        # Longer inputs are split client-side: edge-tts also chunks long
+        # text internally, but opens a fresh websocket per chunk and runs
+        # them sequentially, so our own parts + bounded gather is faster
+        parts = _split_text(text, max_length)
+
+        # Generate parts concurrently; edge-tts is network-bound, so parts
+        # overlap almost fully, but cap in-flight synths to stay under the
+        # Microsoft throttle
+        sem = asyncio.Semaphore(PART_CONCURRENCY)
+
+        async def generate_part(part: str) -> Optional[bytes]:
+            async with sem:
+                return await _generate_single_audio_async(part, voice, rate, pitch, volume)
+
+        part_buffers = await asyncio.gather(*[generate_part(p) for p in parts])
+        if any(buf is None for buf in part_buffers):
+            return None
+
+        # MP3 frames are self-contained, so stitching parts is plain byte
+        # concatenation - no decode/re-encode round trip needed
+        if part_buffers:
+            return b"".join(part_buffers)
+
+        return None
 
 
 def wrap_text_with_ssml(text: str, rate: str = "+0%", pitch: str = "+0Hz", volume: str = "+0%") -> str:
@@ -199,8 +285,8 @@ def wrap_text_with_ssml(text: str, rate: str = "+0%", pitch: str = "+0Hz", volum
     return f'<speak version="1.0" xmlns="http://www.w3.org/2001/10/synthesis" xml:lang="en-US"><prosody rate="{rate}" pitch="{pitch}" volume="{volume}">{text}</prosody></speak>'
 
 
-async def _generate_single_audio_async(text: str, output_file: str, voice: str, rate: str = "+0%", pitch: str = "+0Hz", volume: str = "+0%", max_retries: int = 3) -> bool:
-    """Generate single audio file with retry logic"""
+async def _generate_single_audio_async(text: str, voice: str, rate: str = "+0%", pitch: str = "+0Hz", volume: str = "+0%", max_retries: int = 3) -> Optional[bytes]:
+    """Generate single audio buffer with retry logic"""
     for attempt in range(max_retries):
         try:
             # Wrap text with SSML if any parameter is not default
@@ -209,39 +295,119 @@ async def _generate_single_audio_async(text: str, output_file: str, voice: str,
                 communicate = edge_tts.Communicate(text_with_ssml, voice)
             else:
                 communicate = edge_tts.Communicate(text, voice)
-            await communicate.save(output_file)
-            return True
+            buf = BytesIO()
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    buf.write(chunk["data"])
+            return buf.getvalue()
         except Exception as e:
             if attempt < max_retries - 1:
                 wait_time = (attempt + 1) * 2
                 await asyncio.sleep(wait_time)
             else:
                 print(f"Error after {max_retries} attempts: {e}")
-                return False
-    return False
+                return None
+    return None
 
 
-def upload_to_minio(file_path: str, object_name: str) -> str:
-    """Upload file to MinIO and return object name"""
+async def upload_to_minio(audio: bytes, object_name: str) -> str:
+    """Upload audio bytes to MinIO and return object name"""
     try:
-        minio_client.fput_object(MINIO_BUCKET, object_name, file_path)
+        # put_object is synchronous; run it in a thread so it doesn't
+        # block the event loop for the duration of the S3 round trip
+        await asyncio.to_thread(
+            minio_client.put_object,
+            MINIO_BUCKET,
+            object_name,
+            BytesIO(audio),
+            length=len(audio),
+            content_type="audio/mpeg"
+        )
         return object_name
     except S3Error as e:
         raise HTTPException(status_code=500, detail=f"Failed to upload to MinIO: {str(e)}")
 
 
+# In-process audio cache: repeat generations of the same (text, voice,
+# prosody) tuple skip edge-tts entirely. Bounded by total byte size, with
+# dict insertion order providing LRU eviction
+AUDIO_CACHE_MAX_BYTES = int(os.getenv("TTS_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+_audio_cache = {}
+_audio_cache_bytes = 0
+
+# Default-prosody previews are a handful of fixed strings per voice, so
+# cache those forever; previews with caller-supplied rate/pitch/volume have
+# unbounded key space and go through the size-bounded _audio_cache instead
+_preview_cache = {}
+
+
+def _audio_cache_key(text: str, voice: str, rate: str, pitch: str, volume: str) -> bytes:
+    h = hashlib.blake2b(digest_size=16)
+    for field in (voice, rate, pitch, volume, text):
+        h.update(field.encode())
+        h.update(b"\0")
+    return h.digest()
+
+
+def _audio_cache_get(key: bytes) -> Optional[bytes]:
+    audio = _audio_cache.pop(key, None)
+    if audio is not None:
+        # Re-insert to mark as most recently used
+        _audio_cache[key] = audio
+    return audio
+
+
+def _audio_cache_put(key: bytes, audio: bytes) -> None:
+    global _audio_cache_bytes
+    if len(audio) > AUDIO_CACHE_MAX_BYTES:
+        return
+    _audio_cache_bytes += len(audio) - len(_audio_cache.pop(key, b""))
+    _audio_cache[key] = audio
+    while _audio_cache_bytes > AUDIO_CACHE_MAX_BYTES:
+        _audio_cache_bytes -= len(_audio_cache.pop(next(iter(_audio_cache))))
+
+
 @app.get("/")
 async def root():
     return {"message": "TTS Service API", "version": "1.0.0"}
 
 
+# Voice catalog cache: the list changes on the order of weeks, so a 1-hour
+# TTL removes the Microsoft round trip from nearly every /api/voices call
+VOICES_CACHE_TTL = 3600
+_voices_cache = {"ts": 0.0, "all": [], "by_language": {}}
+_voices_lock = asyncio.Lock()
+
+
+async def _get_cached_voices() -> dict:
+    """Return the voice catalog, refreshing it when the TTL has expired"""
+    if time.time() - _voices_cache["ts"] > VOICES_CACHE_TTL:
+        async with _voices_lock:
+            # Re-check under the lock so only one coroutine refreshes
+            if time.time() - _voices_cache["ts"] > VOICES_CACHE_TTL:
+                voices = await edge_tts.list_voices()
+                by_language = {}
+                for v in voices:
+                    by_language.setdefault(v['Locale'][:2], []).append(v)
+                _voices_cache["all"] = voices
+                _voices_cache["by_language"] = by_language
+                _voices_cache["ts"] = time.time()
+    return _voices_cache
+
+
 @app.get("/api/voices")
 async def list_voices(language: Optional[str] = None):
     """List available voices"""
     try:
-        voices = await edge_tts.list_voices()
+        cache = await _get_cached_voices()
         if language:
-            voices = [v for v in voices if v['Locale'].startswith(language)]
+            # Pre-bucketed by 2-letter language code; narrow further for
+            # full locales like "en-US"
+            voices = cache["by_language"].get(language[:2], [])
+            if len(language) > 2:
+                voices = [v for v in voices if v['Locale'].startswith(language)]
+        else:
+            voices = cache["all"]
         return {"voices": voices}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list voices: {str(e)}")
@@ -257,47 +423,42 @@ async def preview_voice(voice: str, language: Optional[str] = "en", rate: Option
     }
     
     preview_text = preview_texts.get(language, preview_texts["en"])
-    
-    preview_id = str(uuid.uuid4())
-    temp_file = TEMP_DIR / f"preview_{preview_id}.mp3"
-    
+
     try:
         # Generate preview audio with SSML if needed
         rate_val = rate or "+0%"
         pitch_val = pitch or "+0Hz"
         volume_val = volume or "+0%"
-        
-        if rate_val != "+0%" or pitch_val != "+0Hz" or volume_val != "+0%":
-            preview_text_ssml = wrap_text_with_ssml(preview_text, rate_val, pitch_val, volume_val)
-            communicate = edge_tts.Communicate(preview_text_ssml, voice)
+
+        cache_key = _audio_cache_key(preview_text, voice, rate_val, pitch_val, volume_val)
+        default_prosody = rate_val == "+0%" and pitch_val == "+0Hz" and volume_val == "+0%"
+
+        if default_prosody:
+            audio = _preview_cache.get(cache_key)
         else:
-            communicate = edge_tts.Communicate(preview_text, voice)
-        await communicate.save(str(temp_file))
-        
-        # Read file content
-        with open(temp_file, "rb") as f:
-            content = f.read()
-        
-        # Clean up temp file
-        try:
-            os.remove(temp_file)
-        except:
-            pass
-        
-        # Return as streaming response
+            audio = _audio_cache_get(cache_key)
+
+        if audio is None:
+            audio = await _generate_single_audio_async(preview_text, voice, rate_val, pitch_val, volume_val)
+
+            if audio is None:
+                raise HTTPException(status_code=500, detail="Failed to generate preview")
+
+            if default_prosody:
+                _preview_cache[cache_key] = audio
+            else:
+                _audio_cache_put(cache_key, audio)
+
+        # Return audio bytes directly
         return Response(
-            content=content,
+            content=audio,
             media_type="audio/mpeg",
             headers={"Content-Disposition": "inline; filename=preview.mp3"}
         )
-    
+
+    except HTTPException:
+        raise
     except Exception as e:
-        # Clean up on error
-        try:
-            if temp_file.exists():
-                os.remove(temp_file)
-        except:
-            pass
         raise HTTPException(status_code=500, detail=f"Failed to generate preview: {str(e)}")
 
 
@@ -311,36 +472,33 @@ async def generate_tts(request: TTSRequest):
         if not cleaned_text:
             raise HTTPException(status_code=400, detail="Text is empty after cleaning")
         
-        # Generate unique file ID
-        file_id = str(uuid.uuid4())
-        temp_file = TEMP_DIR / f"{file_id}.mp3"
-        
-        # Use default voice if not provided
-        voice = request.voice or "en-US-DavisNeural"
-        
-        # Generate audio
-        success = await generate_audio_async(
-            cleaned_text, 
-            str(temp_file), 
-            voice,
-            request.rate or "+0%",
-            request.pitch or "+0Hz",
-            request.volume or "+0%"
-        )
-        
-        if not success:
-            raise HTTPException(status_code=500, detail="Failed to generate audio")
-        
+        # Generate unique, time-sorted file ID
+        file_id = str(ULID())
+
+        # Serve repeat generations from the in-process cache
+        cache_key = _audio_cache_key(cleaned_text, request.voice, request.rate, request.pitch, request.volume)
+        audio = _audio_cache_get(cache_key)
+
+        if audio is None:
+            # Generate audio under the global concurrency cap
+            async with TTS_SEM:
+                audio = await generate_audio_async(
+                    cleaned_text,
+                    request.voice,
+                    request.rate,
+                    request.pitch,
+                    request.volume
+                )
+
+            if audio is None:
+                raise HTTPException(status_code=500, detail="Failed to generate audio")
+
+            _audio_cache_put(cache_key, audio)
+
         # Upload to MinIO
-        object_name = f"{file_id}.mp3"
-        upload_to_minio(str(temp_file), object_name)
-        
-        # Remove temp file
-        try:
-            os.remove(temp_file)
-        except:
-            pass
-        
+        object_name = _object_name(file_id)
+        await upload_to_minio(audio, object_name)
+
         # Calculate expiration time
         expires_at = datetime.utcnow() + CLEANUP_INTERVAL
         
@@ -356,36 +514,156 @@ async def generate_tts(request: TTSRequest):
         raise HTTPException(status_code=500, detail=f"Error generating audio: {str(e)}")
 
 
+# Strong references to in-flight background uploads; the event loop only
+# holds weak refs to tasks
+_persist_tasks = set()
+
+
+@app.post("/api/stream")
+async def stream_tts(request: TTSRequest):
+    """Stream TTS audio to the client as it is synthesized"""
+    cleaned_text = clean_text(request.text)
+
+    if not cleaned_text:
+        raise HTTPException(status_code=400, detail="Text is empty after cleaning")
+
+    file_id = str(ULID())
+
+    if request.rate != "+0%" or request.pitch != "+0Hz" or request.volume != "+0%":
+        text = wrap_text_with_ssml(cleaned_text, request.rate, request.pitch, request.volume)
+    else:
+        text = cleaned_text
+    communicate = edge_tts.Communicate(text, request.voice)
+
+    async def _persist(audio: bytes):
+        try:
+            await upload_to_minio(audio, _object_name(file_id))
+        except Exception as e:
+            detail = getattr(e, "detail", e)
+            print(f"Failed to persist streamed audio {file_id}: {detail}")
+
+    async def audio_stream():
+        # Yield chunks as edge-tts emits them so playback can start on the
+        # first frame; keep a copy so the file is also downloadable later
+        buf = BytesIO()
+        async with TTS_SEM:
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    buf.write(chunk["data"])
+                    yield chunk["data"]
+        # Persist in the background so it doesn't delay stream close; keep
+        # a strong reference so the task can't be garbage-collected mid-upload
+        task = asyncio.create_task(_persist(buf.getvalue()))
+        _persist_tasks.add(task)
+        task.add_done_callback(_persist_tasks.discard)
+
+    return StreamingResponse(
+        audio_stream(),
+        media_type="audio/mpeg",
+        headers={
+            "Content-Disposition": f'inline; filename="{file_id}.mp3"',
+            "X-File-ID": file_id,
+            "X-Download-URL": f"/api/download/{file_id}"
+        }
+    )
+
+
+# Range header as sent by browser audio elements: bytes=start-end,
+# bytes=start- or bytes=-suffix
+_RANGE_RE = re.compile(r'bytes=(\d*)-(\d*)$')
+
+# Bounded LRU of object sizes so scrubbing doesn't stat per seek
+_SIZE_CACHE_MAX = 1024
+_size_cache = {}
+
+
+async def _object_size(object_name: str) -> int:
+    size = _size_cache.pop(object_name, None)
+    if size is None:
+        stat = await asyncio.to_thread(minio_client.stat_object, MINIO_BUCKET, object_name)
+        size = stat.size
+        if len(_size_cache) >= _SIZE_CACHE_MAX:
+            # dicts iterate in insertion order, so this evicts the oldest
+            _size_cache.pop(next(iter(_size_cache)))
+    # Re-insert to mark as most recently used
+    _size_cache[object_name] = size
+    return size
+
+
+def _stream_minio_response(resp):
+    async def iter_audio():
+        chunks = resp.stream(64 * 1024)
+        try:
+            while True:
+                chunk = await asyncio.to_thread(next, chunks, None)
+                if chunk is None:
+                    break
+                yield chunk
+        finally:
+            resp.close()
+            resp.release_conn()
+    return iter_audio()
+
+
 @app.get("/api/download/{file_id}")
-async def download_file(file_id: str):
-    """Download audio file from MinIO"""
+async def download_file(file_id: str, request: Request):
+    """Download audio file from MinIO, honoring Range requests for seeking"""
     try:
-        object_name = f"{file_id}.mp3"
-        temp_file = TEMP_DIR / f"{file_id}.mp3"
-        
-        # Download from MinIO
-        minio_client.fget_object(MINIO_BUCKET, object_name, str(temp_file))
-        
-        # Read file content and return
-        with open(temp_file, "rb") as f:
-            content = f.read()
-        
-        # Clean up temp file
-        try:
-            os.remove(temp_file)
-        except:
-            pass
-        
-        # Return as response
-        return Response(
-            content=content,
+        if not _FILE_ID_RE.match(file_id):
+            raise HTTPException(status_code=404, detail="File not found")
+
+        object_name = _object_name(file_id)
+        headers = {
+            "Content-Disposition": f'attachment; filename="{file_id}.mp3"',
+            "Accept-Ranges": "bytes"
+        }
+
+        range_match = _RANGE_RE.match(request.headers.get("range", ""))
+        if range_match and (range_match.group(1) or range_match.group(2)):
+            # Serve just the requested byte window via a ranged get_object
+            total = await _object_size(object_name)
+            start_s, end_s = range_match.groups()
+            if start_s:
+                start = int(start_s)
+                end = min(int(end_s), total - 1) if end_s else total - 1
+            else:
+                # Suffix range: last N bytes
+                start = max(total - int(end_s), 0)
+                end = total - 1
+
+            if start >= total or start > end:
+                raise HTTPException(
+                    status_code=416,
+                    detail="Requested range not satisfiable",
+                    headers={"Content-Range": f"bytes */{total}"}
+                )
+
+            length = end - start + 1
+            resp = await asyncio.to_thread(
+                minio_client.get_object, MINIO_BUCKET, object_name,
+                offset=start, length=length
+            )
+            headers.update({
+                "Content-Range": f"bytes {start}-{end}/{total}",
+                "Content-Length": str(length)
+            })
+            return StreamingResponse(
+                _stream_minio_response(resp),
+                status_code=206,
+                media_type="audio/mpeg",
+                headers=headers
+            )
+
+        # Full-object path, streamed from MinIO without touching disk
+        resp = await asyncio.to_thread(minio_client.get_object, MINIO_BUCKET, object_name)
+        return StreamingResponse(
+            _stream_minio_response(resp),
             media_type="audio/mpeg",
-            headers={
-                "Content-Disposition": f'attachment; filename="{file_id}.mp3"',
-                "Content-Length": str(len(content))
-            }
+            headers=headers
         )
-    
+
+    except HTTPException:
+        raise
     except S3Error as e:
         if e.code == "NoSuchKey":
             raise HTTPException(status_code=404, detail="File not found")
@@ -398,38 +676,90 @@ async def download_file(file_id: str):
 async def cleanup_old_files():
     """Manual cleanup of old files (called by scheduled task)"""
     try:
-        # List all objects in bucket
-        objects = minio_client.list_objects(MINIO_BUCKET, recursive=True)
-        
-        deleted_count = 0
-        now = datetime.utcnow()
-        
-        for obj in objects:
-            # Check if object is older than cleanup interval
-            if obj.last_modified and (now - obj.last_modified.replace(tzinfo=None)) > CLEANUP_INTERVAL:
-                try:
-                    minio_client.remove_object(MINIO_BUCKET, obj.object_name)
-                    deleted_count += 1
-                except:
-                    pass
-        
+        # Compare epoch floats instead of allocating a timedelta per object
+        cutoff = time.time() - CLEANUP_INTERVAL.total_seconds()
+        cutoff_prefix = _time_prefix(cutoff)
+
+        def remove_expired() -> int:
+            # Walk time-bucket prefixes instead of the whole bucket and
+            # stream expired objects straight into remove_objects, which
+            # batches up to 1000 keys per RPC
+            submitted = 0
+
+            def candidates():
+                nonlocal submitted
+                # Non-recursive listing yields one entry per time-bucket
+                # prefix; only windows at or before the cutoff prefix can
+                # hold expired objects
+                for entry in minio_client.list_objects(MINIO_BUCKET):
+                    if entry.is_dir:
+                        prefix = entry.object_name
+                        if prefix.rstrip('/') > cutoff_prefix:
+                            continue
+                        # A window strictly before the cutoff prefix is
+                        # expired wholesale; the boundary window still
+                        # needs per-object mtime checks
+                        whole_window = prefix.rstrip('/') < cutoff_prefix
+                        for obj in minio_client.list_objects(MINIO_BUCKET, prefix=prefix, recursive=True):
+                            if whole_window or (obj.last_modified and obj.last_modified.timestamp() < cutoff):
+                                submitted += 1
+                                yield DeleteObject(obj.object_name)
+                    elif entry.last_modified and entry.last_modified.timestamp() < cutoff:
+                        # Flat key from before the prefix scheme
+                        submitted += 1
+                        yield DeleteObject(entry.object_name)
+
+            errors = sum(1 for _ in minio_client.remove_objects(MINIO_BUCKET, candidates()))
+            return submitted - errors
+
+        deleted_count = await asyncio.to_thread(remove_expired)
+
         return {"deleted": deleted_count, "message": "Cleanup completed"}
-    
+
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error during cleanup: {str(e)}")
 
 
+# Health probe cache refreshed by a background heartbeat so frequent
+# liveness/readiness polls don't each cost a MinIO round trip
+HEALTH_PROBE_INTERVAL = 5
+_health = {"ok": True, "ts": 0.0}
+_health_task = None
+
+
+async def _health_loop():
+    while True:
+        try:
+            _health["ok"] = await asyncio.to_thread(minio_client.bucket_exists, MINIO_BUCKET)
+        except:
+            _health["ok"] = False
+        _health["ts"] = time.time()
+        await asyncio.sleep(HEALTH_PROBE_INTERVAL)
+
+
+@app.on_event("startup")
+async def start_health_heartbeat():
+    # Keep a strong reference so the loop can't be garbage-collected;
+    # the event loop only holds weak refs to tasks
+    global _health_task
+    _health_task = asyncio.create_task(_health_loop())
+
+
 @app.get("/api/health")
 async def health_check():
     """Health check endpoint"""
-    try:
-        # Check MinIO connection
-        minio_client.bucket_exists(MINIO_BUCKET)
-        return {"status": "healthy", "minio": "connected"}
-    except:
-        return {"status": "degraded", "minio": "disconnected"}
+    if _health["ok"]:
+        return {"status": "healthy", "minio": "connected", "tts_slots_available": TTS_SEM._value}
+    return {"status": "degraded", "minio": "disconnected", "tts_slots_available": TTS_SEM._value}
 
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=os.cpu_count()
+    )
 